@@ -0,0 +1,49 @@
+"""
+aot_compile.py — M3 Challenge 2026 Q1
+
+Ahead-of-time compile the scalar Numba kernels into an extension module,
+m3_kernels, so short-lived sessions skip JIT compilation on first call.
+
+Usage
+-----
+    python aot_compile.py
+
+This writes m3_kernels.<platform>.so (or .pyd) next to this file. The tax and
+expenditure modules import it when present (see jit.py) and fall back to the
+JIT kernels otherwise. Model constants are kernel arguments, so the build
+stays valid when constants.py changes; re-run this script after changing a
+kernel, and bump jit.AOT_ABI_VERSION when an exported signature changes
+(older builds are then ignored).
+
+Requires Numba with numba.pycc available.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from expenditure_model import _essential_totals_kernel
+from jit import AOT_ABI_VERSION
+from tax_calculator import _fed_tax_cents, _fica_cents
+
+cc = CC('m3_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _abi_version():
+    """Signature version this build was compiled against (see jit.py)."""
+    return AOT_ABI_VERSION
+
+
+cc.export('abi_version', 'i8()')(_abi_version)
+cc.export('fed_tax_cents', 'i8(i8, i8[:], i8[:], i8)')(_fed_tax_cents.py_func)
+cc.export('fica_cents', 'UniTuple(i8, 3)(i8, i8, i8, i8, i8, i8, i8)')(_fica_cents.py_func)
+cc.export(
+    'essential_totals',
+    'UniTuple(f8, 2)(f8[:], f8[:], f8[:], f8[:], f8, f8, f8, f8)',
+)(_essential_totals_kernel.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print(f"Compiled m3_kernels into {cc.output_dir}")
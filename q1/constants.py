@@ -13,6 +13,8 @@ Sources:
   - BLS Consumer Expenditure Survey 2024 — essential fraction (alpha) values
 """
 
+import numpy as np
+
 # ---------------------------------------------------------------------------
 # 1. FEDERAL INCOME TAX — 2025 (IRS Rev. Proc. 2024-61)
 # ---------------------------------------------------------------------------
@@ -32,6 +34,29 @@ FEDERAL_BRACKETS_SINGLE_2025 = [
     (None,      0.37),
 ]
 
+# Taxes are computed in integer cents with rates as integer multiples of
+# 1/RATE_DEN (basis points), so bracket and payroll sums are exact and the
+# only rounding is one half-up division by RATE_DEN.
+RATE_DEN = 10_000
+
+# Bracket table precompiled into int64 arrays for branchless evaluation:
+#   tax_cents(ti) = Σ_k BRACKET_RATE_BP[k] × clip(ti − BRACKET_EDGES_CENTS[k],
+#                                                 0, BRACKET_W_CENTS[k]) / RATE_DEN
+# BRACKET_EDGES_CENTS has len(brackets) + 1 entries, ending in an int64-max
+# sentinel for the open top bracket.
+STANDARD_DEDUCTION_CENTS = STANDARD_DEDUCTION_SINGLE * 100
+BRACKET_EDGES_CENTS = np.array(
+    [0]
+    + [upper * 100 for upper, _ in FEDERAL_BRACKETS_SINGLE_2025[:-1]]
+    + [np.iinfo(np.int64).max],
+    dtype=np.int64,
+)
+BRACKET_W_CENTS = np.diff(BRACKET_EDGES_CENTS)
+BRACKET_RATE_BP = np.array(
+    [round(rate * RATE_DEN) for _, rate in FEDERAL_BRACKETS_SINGLE_2025],
+    dtype=np.int64,
+)
+
 # ---------------------------------------------------------------------------
 # 2. FICA — 2025
 # ---------------------------------------------------------------------------
@@ -45,6 +70,20 @@ MEDICARE_RATE = 0.0145
 MEDICARE_SURCHARGE_RATE = 0.009
 MEDICARE_SURCHARGE_THRESHOLD = 200_000
 
+# Integer-cent / basis-point forms (see RATE_DEN above)
+SS_RATE_BP = round(SS_RATE * RATE_DEN)
+SS_WAGE_BASE_CENTS = SS_WAGE_BASE * 100
+MEDICARE_RATE_BP = round(MEDICARE_RATE * RATE_DEN)
+MEDICARE_SURCHARGE_RATE_BP = round(MEDICARE_SURCHARGE_RATE * RATE_DEN)
+MEDICARE_SURCHARGE_THRESHOLD_CENTS = MEDICARE_SURCHARGE_THRESHOLD * 100
+
+# Every rate must be exactly representable in basis points
+for _rate in [r for _, r in FEDERAL_BRACKETS_SINGLE_2025] + [
+        SS_RATE, MEDICARE_RATE, MEDICARE_SURCHARGE_RATE]:
+    assert abs(_rate * RATE_DEN - round(_rate * RATE_DEN)) < 1e-9, \
+        f"Tax rate {_rate} is not a whole number of 1/{RATE_DEN}"
+del _rate
+
 # ---------------------------------------------------------------------------
 # 3. STATE INCOME TAX — 2025 effective rates (Tax Foundation 2025)
 #
@@ -128,11 +167,12 @@ STATE_TAX_SCHEDULE = {
     'North Carolina': [(0, 0.045)],
 
     # Virginia — progressive to 5.75%
+    # (the 3%/5% step at $17,001 is collapsed to its midpoint so thresholds
+    # stay strictly increasing)
     'Virginia': [
         (0,       0.00),
         (17_000,  0.020),
-        (17_001,  0.030),
-        (17_001,  0.050),
+        (17_001,  0.040),
         (50_000,  0.055),
         (100_000, 0.057),
         (200_000, 0.058),
@@ -151,6 +191,49 @@ STATE_TAX_SCHEDULE = {
     'Tennessee': [(0, 0.0)],
 }
 
+# np.interp requires strictly increasing thresholds; catch bad edits at import
+for _state, _pts in STATE_TAX_SCHEDULE.items():
+    _xs = [inc for inc, _ in _pts]
+    assert all(b > a for a, b in zip(_xs, _xs[1:])), \
+        f"STATE_TAX_SCHEDULE['{_state}'] thresholds are not strictly increasing"
+del _state, _pts, _xs
+
+# Single-breakpoint (flat-rate) states: tax = rate × income, no interpolation
+FLAT_STATE_RATE = {
+    state: pts[0][1]
+    for state, pts in STATE_TAX_SCHEDULE.items()
+    if len(pts) == 1
+}
+
+# States with no wage income tax (TX, FL, NV, WA, WY, TN): tax is always 0
+ZERO_TAX_STATES = frozenset(
+    state for state, pts in STATE_TAX_SCHEDULE.items()
+    if all(rate == 0.0 for _, rate in pts)
+)
+
+# Breakpoints as parallel sorted NumPy arrays for np.interp:
+# STATE_TAX_SCHEDULE_ARR[state] = (thresholds, effective_rates). Built once
+# at import.
+STATE_TAX_SCHEDULE_ARR = {
+    state: (
+        np.fromiter((inc for inc, _ in pts), dtype=np.float64),
+        np.fromiter((rate for _, rate in pts), dtype=np.float64),
+    )
+    for state, pts in STATE_TAX_SCHEDULE.items()
+}
+
+# The same schedules packed into (n_states, max_breakpoints) arrays for the
+# fused tax kernel: row STATE_TAX_ROW[state] holds STATE_TAX_N[row] valid
+# breakpoints, the rest is zero padding.
+STATE_TAX_ROW = {state: i for i, state in enumerate(STATE_TAX_SCHEDULE)}
+STATE_TAX_N = np.array([len(pts) for pts in STATE_TAX_SCHEDULE.values()], dtype=np.int64)
+STATE_TAX_X_PAD = np.zeros((len(STATE_TAX_SCHEDULE), STATE_TAX_N.max()))
+STATE_TAX_Y_PAD = np.zeros_like(STATE_TAX_X_PAD)
+for _row, (_xs, _ys) in enumerate(STATE_TAX_SCHEDULE_ARR.values()):
+    STATE_TAX_X_PAD[_row, :_xs.size] = _xs
+    STATE_TAX_Y_PAD[_row, :_ys.size] = _ys
+del _row, _xs, _ys
+
 # Map state → BLS region for expenditure lookup
 STATE_TO_REGION = {
     # Northeast
@@ -179,6 +262,16 @@ STATE_TO_REGION = {
     'Oregon': 'West', 'Washington': 'West',
 }
 
+# Integer-coded states and regions for array lookups:
+#   REGIONS[REGION_OF[STATE_ID[state]]] == STATE_TO_REGION[state]
+REGIONS = ('Northeast', 'Midwest', 'South', 'West')
+REGION_ID = {region: i for i, region in enumerate(REGIONS)}
+ALL_STATES = sorted(STATE_TO_REGION)
+STATE_ID = {state: i for i, state in enumerate(ALL_STATES)}
+REGION_OF = np.array(
+    [REGION_ID[STATE_TO_REGION[state]] for state in ALL_STATES], dtype=np.int8
+)
+
 # ---------------------------------------------------------------------------
 # 4. EXPENDITURE ESSENTIAL FRACTIONS (alpha)
 #    Source: BLS CES 2024; food-at-home vs away-from-home split from USDA ERS
@@ -231,6 +324,25 @@ INCOME_ELASTICITY = {
     'Personal insurance': 0.95,
 }
 
+# Canonical category order shared by data_loader's expenditure matrices and
+# the alpha/beta vectors below (BLS CES row order).
+CATEGORIES_ORDERED = [
+    'Food',
+    'Housing',
+    'Utilities, fuel, public services',
+    'Household operations',
+    'Housekeeping supplies',
+    'Household furnishings and equipement',
+    'Apparel and services',
+    'Transportation',
+    'Healthcare',
+    'Entertainment',
+    'Personal care',
+    'Education',
+    'Miscellaneous',
+    'Personal insurance',
+]
+
 # ---------------------------------------------------------------------------
 # 6. AVERAGE INCOME BY AGE GROUP (AVG_INCOME_BY_AGE)
 #    Source: BLS CPS Table A-9, 2024 median usual weekly earnings, full-time
@@ -248,6 +360,12 @@ AVG_INCOME_BY_AGE = {
     '75 and older': 44_000,  # BLS CPS + Census P60 estimate
 }
 
+# Age-group bucketing: AGE_GROUP_NAMES[np.searchsorted(AGE_BINS, age, side='right')]
+# AGE_BINS holds the first age of every group after 'Under 25'.
+AGE_BINS = np.array([25, 35, 45, 55, 65, 75])
+AGE_GROUP_NAMES = np.array(['Under 25', '25-34', '35-44', '45-54',
+                            '55-64', '65-74', '75 and older'])
+
 # ---------------------------------------------------------------------------
 # 7. DEMOGRAPHIC PROFILES for demonstration (Section 5 of notebook)
 # ---------------------------------------------------------------------------
@@ -262,3 +380,18 @@ DEMO_PROFILES = [
     {'label': 'P7', 'age': 67, 'salary': 48_000,  'state': 'Georgia',    'archetype': 'Early retiree'},
     {'label': 'P8', 'age': 22, 'salary': 28_000,  'state': 'Texas',      'archetype': 'Low-income'},
 ]
+
+# Columnar (structured-array) view of the profiles for the batch model:
+# DEMO_PROFILES_ARRAY['salary'] etc. are contiguous arrays.
+PROFILE_DTYPE = np.dtype([
+    ('label', 'U16'),
+    ('age', 'i4'),
+    ('salary', 'f8'),
+    ('state', 'U20'),
+    ('archetype', 'U64'),
+])
+DEMO_PROFILES_ARRAY = np.array(
+    [(p['label'], p['age'], p['salary'], p['state'], p['archetype'])
+     for p in DEMO_PROFILES],
+    dtype=PROFILE_DTYPE,
+)
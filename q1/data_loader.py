@@ -26,16 +26,34 @@ Output schema:
           'Northeast': 115770.0,
           ...
       },
+      'exp_matrix_by_age':    np.ndarray (n_categories, n_age_groups),
+      'exp_matrix_by_region': np.ndarray (n_categories, n_regions),
+      'cat_index':    {'Food': 0, ...},     # matrix row per category
+      'age_index':    {'Under 25': 0, ...}, # matrix column per age group
+      'region_index': {'Northeast': 0, ...},
   }
 
+The matrices hold the same values as 'by_age' / 'by_region' in
+category-major (struct-of-arrays) layout; missing cells are 0.0.
+
 Source: M3-Challenge-Problem-Data-2026.xlsx, sheet 'Expenditures (U.S.)'
 BLS Consumer Expenditure Survey 2024.
 """
 
+import functools
 import os
+from contextlib import closing
 import re
+import numpy as np
 import openpyxl
 
+from constants import (
+    AGE_GROUP_NAMES,
+    AVG_INCOME_BY_AGE,
+    CATEGORIES_ORDERED,
+    REGIONS,
+)
+
 
 # ---------------------------------------------------------------------------
 # Layout constants (row/column indices, 0-based)
@@ -64,24 +82,16 @@ _REGION_COLS = {
 
 _MEAN_INCOME_ROW = 3  # 'Mean income before taxes'
 
-# Expenditure categories to extract (row labels, stripped)
-_EXPENDITURE_CATEGORIES = [
-    'Food',
-    'Housing',
-    'Utilities, fuel, public services',
-    'Household operations',
-    'Housekeeping supplies',
-    'Household furnishings and equipement',
-    'Apparel and services',
-    'Transportation',
-    'Healthcare',
-    'Entertainment',
-    'Personal care',
-    'Education',
-    'Miscellaneous',
-    'Personal insurance',
-    'All expenditures',
-]
+# Expenditure categories to extract (row labels, stripped), in the canonical
+# order of constants.CATEGORIES_ORDERED plus the 'All expenditures' total
+_EXPENDITURE_CATEGORIES = CATEGORIES_ORDERED + ['All expenditures']
+
+# Case-insensitive label → canonical category name
+_CAT_LOOKUP = {cat.lower(): cat for cat in _EXPENDITURE_CATEGORIES}
+
+
+# Thousands separators and currency signs stripped from numeric strings
+_NUM_RE = re.compile(r'[,$]')
 
 
 def _parse_number(val):
@@ -91,18 +101,56 @@ def _parse_number(val):
     if isinstance(val, (int, float)):
         return float(val)
     if isinstance(val, str):
-        cleaned = val.replace(',', '').replace('$', '').strip()
         try:
-            return float(cleaned)
+            return float(_NUM_RE.sub('', val).strip())
         except ValueError:
             return None
     return None
 
 
+def _parse_column(values) -> np.ndarray:
+    """
+    Parse a column of cell values into a float array (NaN if unparseable).
+
+    Numeric cells are cast in one step; string cells are cleaned with
+    np.char and cast together, falling back to _parse_number() per cell
+    only if some string in the column is not a number.
+    """
+    values = np.asarray(values, dtype=object)
+    out = np.full(values.shape, np.nan)
+
+    is_num = np.fromiter(
+        (isinstance(v, (int, float)) for v in values), dtype=bool, count=values.size
+    )
+    is_str = np.fromiter(
+        (isinstance(v, str) for v in values), dtype=bool, count=values.size
+    )
+    out[is_num] = values[is_num].astype(np.float64)
+
+    if is_str.any():
+        strings = values[is_str].astype(str)
+        cleaned = np.char.strip(
+            np.char.replace(np.char.replace(strings, ',', ''), '$', '')
+        )
+        try:
+            out[is_str] = cleaned.astype(np.float64)
+        except ValueError:
+            # None (unparseable) becomes NaN in a float array
+            out[is_str] = np.array(
+                [_parse_number(x) for x in strings], dtype=np.float64
+            )
+    return out
+
+
 def load_expenditure_data(excel_path: str) -> dict:
     """
     Parse 'Expenditures (U.S.)' sheet from the M3 Excel file.
 
+    Results are memoized on (absolute path, modification time), so repeated
+    calls — e.g. notebook re-runs — skip the openpyxl parse until the file
+    changes on disk. The returned dict is shared between calls and should be
+    treated as read-only.
+
     Parameters
     ----------
     excel_path : str
@@ -111,16 +159,40 @@ def load_expenditure_data(excel_path: str) -> dict:
     Returns
     -------
     dict with keys: 'by_age', 'by_region', 'mean_income_by_age',
-                    'mean_income_by_region', 'categories'
+                    'mean_income_by_region', 'categories',
+                    'exp_matrix_by_age', 'exp_matrix_by_region',
+                    'cat_index', 'age_index', 'region_index',
+                    'age_bls_mat', 'reg_bls_mat', 'avg_income_vec'
+
+    The last three are the read-only tables the expenditure model indexes
+    directly: (n_age_groups, k) and (n_regions, k) BLS baselines with rows
+    in AGE_GROUP_NAMES / REGIONS order and columns in 'categories' order,
+    and the (n_age_groups,) Engel reference income per age group.
     """
-    wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
-    ws = wb['Expenditures (U.S.)']
-
-    # Read all rows into a list for random access
-    rows = list(ws.iter_rows(values_only=True))
+    path = os.path.abspath(excel_path)
+    return _load_raw(path, os.path.getmtime(path))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_raw(excel_path: str, mtime: float) -> dict:
+    """Uncached parse behind load_expenditure_data(); mtime is the cache key."""
+    # Workbook is not a context manager itself; closing() guarantees the
+    # read-only archive is released even if reading the sheet fails.
+    with closing(openpyxl.load_workbook(excel_path, read_only=True, data_only=True)) as wb:
+        ws = wb['Expenditures (U.S.)']
+
+        # Read only the rows we use (openpyxl rows are 1-based). In read-only
+        # mode the sheet XML is streamed, so skipped rows are never parsed.
+        income_row = next(ws.iter_rows(
+            min_row=_MEAN_INCOME_ROW + 1, max_row=_MEAN_INCOME_ROW + 1,
+            values_only=True,
+        ))
+        data_rows = list(ws.iter_rows(
+            min_row=_DATA_START_ROW + 1, max_row=_DATA_END_ROW + 1,
+            values_only=True,
+        ))
 
     # ---- Mean income by age group ----------------------------------------
-    income_row = rows[_MEAN_INCOME_ROW]
     mean_income_by_age = {
         age: _parse_number(income_row[col])
         for age, col in _AGE_COLS.items()
@@ -131,49 +203,94 @@ def load_expenditure_data(excel_path: str) -> dict:
     }
 
     # ---- Expenditure data -------------------------------------------------
-    by_age = {age: {} for age in _AGE_COLS}
-    by_region = {region: {} for region in _REGION_COLS}
-
-    for row_idx in range(_DATA_START_ROW, _DATA_END_ROW + 1):
-        if row_idx >= len(rows):
-            break
-        row = rows[row_idx]
+    # Keep rows whose label matches a known category (case-insensitive,
+    # strip trailing spaces), in sheet order
+    matched_cats = []
+    matched_rows = []
+    for row in data_rows:
         label = str(row[0]).strip() if row[0] is not None else ''
+        matched_cat = _CAT_LOOKUP.get(label.lower())
+        if matched_cat is not None:
+            matched_cats.append(matched_cat)
+            matched_rows.append(row)
+
+    # One (n_rows, n_cols) object block, parsed column-wise into floats
+    n_cols = max(_REGION_COLS.values()) + 1
+    block = np.array(
+        [tuple(row[:n_cols]) + (None,) * (n_cols - len(row)) for row in matched_rows],
+        dtype=object,
+    ).reshape(len(matched_rows), n_cols)
+    age_values = np.stack(
+        [_parse_column(block[:, col]) for col in _AGE_COLS.values()], axis=1
+    )
+    region_values = np.stack(
+        [_parse_column(block[:, col]) for col in _REGION_COLS.values()], axis=1
+    )
+
+    # Dict interface: unparseable cells (NaN) are left out, as before
+    by_age = {
+        age: {cat: float(v) for cat, v in zip(matched_cats, age_values[:, j])
+              if not np.isnan(v)}
+        for j, age in enumerate(_AGE_COLS)
+    }
+    by_region = {
+        region: {cat: float(v) for cat, v in zip(matched_cats, region_values[:, j])
+                 if not np.isnan(v)}
+        for j, region in enumerate(_REGION_COLS)
+    }
 
-        # Match against known categories (case-insensitive, strip trailing spaces)
-        matched_cat = None
-        for cat in _EXPENDITURE_CATEGORIES:
-            if label.lower() == cat.lower():
-                matched_cat = cat
-                break
-
-        if matched_cat is None:
-            continue  # skip rows we don't need
-
-        for age, col in _AGE_COLS.items():
-            val = _parse_number(row[col])
-            if val is not None:
-                by_age[age][matched_cat] = val
-
-        for region, col in _REGION_COLS.items():
-            val = _parse_number(row[col])
-            if val is not None:
-                by_region[region][matched_cat] = val
-
-    wb.close()
+    # ---- Struct-of-arrays view for vectorized consumers -------------------
+    categories = list(CATEGORIES_ORDERED)
+    cat_index = {cat: i for i, cat in enumerate(categories)}
+    exp_matrix_by_age = np.zeros((len(categories), len(_AGE_COLS)))
+    exp_matrix_by_region = np.zeros((len(categories), len(_REGION_COLS)))
+    for r, cat in enumerate(matched_cats):
+        if cat in cat_index:
+            exp_matrix_by_age[cat_index[cat]] = np.nan_to_num(age_values[r])
+            exp_matrix_by_region[cat_index[cat]] = np.nan_to_num(region_values[r])
+
+    # Row-major model tables: one row per age group / region, columns in
+    # 'categories' order (selected through cat_index)
+    age_index = {age: j for j, age in enumerate(_AGE_COLS)}
+    region_index = {region: j for j, region in enumerate(_REGION_COLS)}
+    cat_rows = [cat_index[cat] for cat in categories]
+    age_bls_mat = np.ascontiguousarray(
+        exp_matrix_by_age[cat_rows][:, [age_index[group] for group in AGE_GROUP_NAMES]].T
+    )
+    reg_bls_mat = np.ascontiguousarray(
+        exp_matrix_by_region[cat_rows][:, [region_index[region] for region in REGIONS]].T
+    )
+    # Use BLS CES mean household income for each age group as the Engel
+    # scaling reference point. This is internally consistent: the BLS CES
+    # expenditure data is calibrated to this same survey's income measure.
+    # BLS CPS individual earnings (AVG_INCOME_BY_AGE) are the fallback only.
+    avg_income_vec = np.array([
+        mean_income_by_age.get(group, AVG_INCOME_BY_AGE[group])
+        for group in AGE_GROUP_NAMES
+    ], dtype=np.float64)
+    for arr in (age_bls_mat, reg_bls_mat, avg_income_vec):
+        arr.flags.writeable = False
 
     return {
         'by_age': by_age,
         'by_region': by_region,
         'mean_income_by_age': mean_income_by_age,
         'mean_income_by_region': mean_income_by_region,
-        'categories': [c for c in _EXPENDITURE_CATEGORIES if c != 'All expenditures'],
+        'categories': categories,
         'all_expenditures_by_age': {
             age: by_age[age].get('All expenditures') for age in _AGE_COLS
         },
         'all_expenditures_by_region': {
             region: by_region[region].get('All expenditures') for region in _REGION_COLS
         },
+        'exp_matrix_by_age': exp_matrix_by_age,
+        'exp_matrix_by_region': exp_matrix_by_region,
+        'cat_index': cat_index,
+        'age_index': age_index,
+        'region_index': region_index,
+        'age_bls_mat': age_bls_mat,
+        'reg_bls_mat': reg_bls_mat,
+        'avg_income_vec': avg_income_vec,
     }
 
 
@@ -45,8 +45,150 @@ Federal Reserve SHED (2025). Report on Economic Well-Being. federalreserve.gov
 MIT Living Wage Calculator (Feb 2026). livingwage.mit.edu
 """
 
-from tax_calculator import compute_all_taxes
-from expenditure_model import compute_essential_expenses
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from tax_calculator import (
+    compute_all_taxes,
+    compute_federal_tax_batch,
+    compute_fica_batch,
+    compute_state_tax_batch,
+)
+from expenditure_model import (
+    CategoryResult,
+    compute_essential_expenses,
+    compute_essential_expenses_batch,
+)
+from jit import NUMBA_AVAILABLE
+
+
+_ASSUMPTIONS = [
+    'Single filer, standard deduction ($15,000, IRS 2025)',
+    'Salary is sole income source',
+    'State rates: 2025 effective rates at income level (Tax Foundation)',
+    'BLS CES 2024 household expenditure, treated as individual',
+    'Engel curve: constant elasticity (power law) approximation of QUAIDS',
+    'No 401(k)/IRA deductions; voluntary savings treated as disposable',
+    'Static model: no career progression or inflation',
+]
+
+# as_dict() keys that map straight to one DIResult field
+_FLAT_KEYS = {
+    'gross_income': 'gross_income',
+    'age': 'age',
+    'state': 'state',
+    'total_tax': 'total_tax',
+    'effective_tax_rate': 'effective_tax_rate',
+    'expenses': 'expenses',
+    'total_essential': 'total_essential',
+    'total_all_expenses': 'total_all_expenses',
+    'disposable_income': 'disposable',
+    'di_fraction': 'di_fraction',
+    'age_group': 'age_group',
+    'region': 'region',
+    'income_ratio': 'income_ratio',
+}
+
+
+@dataclass(slots=True)
+class DIResult:
+    """
+    Disposable income breakdown for one individual.
+
+    All amounts are unrounded USD floats; rounding is left to format_result()
+    and other presentation code. as_dict() materializes the nested dict
+    layout; item access (result['taxes']['federal'], ...) accepts the same
+    keys so dict-style callers keep working, reading flat keys straight from
+    the fields and building only the nested value that was asked for.
+    """
+    # Inputs
+    gross_income: float
+    age: int
+    state: str
+
+    # Taxes
+    federal: float
+    social_security: float
+    medicare: float
+    fica_total: float
+    state_tax: float
+    total_tax: float
+    effective_tax_rate: float
+
+    # Expenses (compute_essential_expenses() output)
+    expenses: dict
+    total_essential: float
+    total_all_expenses: float
+
+    # Disposable Income
+    disposable: float
+    di_fraction: float
+
+    # Demographics
+    age_group: str
+    region: str
+    income_ratio: float
+
+    # Optional profile metadata (set by run_all_profiles)
+    label: str = None
+    archetype: str = None
+
+    @property
+    def assumptions(self) -> list:
+        return list(_ASSUMPTIONS)
+
+    def as_dict(self) -> dict:
+        """Return the result as the nested dict documented in compute_disposable_income()."""
+        d = {
+            'gross_income': self.gross_income,
+            'age': self.age,
+            'state': self.state,
+            'taxes': self._taxes(),
+            'total_tax': self.total_tax,
+            'effective_tax_rate': self.effective_tax_rate,
+            'expenses': self.expenses,
+            'total_essential': self.total_essential,
+            'total_all_expenses': self.total_all_expenses,
+            'disposable_income': self.disposable,
+            'di_fraction': self.di_fraction,
+            'age_group': self.age_group,
+            'region': self.region,
+            'income_ratio': self.income_ratio,
+            'assumptions': self.assumptions,
+        }
+        if self.label is not None:
+            d['label'] = self.label
+        if self.archetype is not None:
+            d['archetype'] = self.archetype
+        return d
+
+    def _taxes(self) -> dict:
+        """The nested 'taxes' value of as_dict()."""
+        return {
+            'federal': self.federal,
+            'social_security': self.social_security,
+            'medicare': self.medicare,
+            'fica_total': self.fica_total,
+            'state': self.state_tax,
+            'total': self.total_tax,
+        }
+
+    def __getitem__(self, key: str):
+        field = _FLAT_KEYS.get(key)
+        if field is not None:
+            return getattr(self, field)
+        if key == 'taxes':
+            return self._taxes()
+        if key == 'assumptions':
+            return self.assumptions
+        if key in ('label', 'archetype'):
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
 
 
 def compute_disposable_income(
@@ -55,7 +197,7 @@ def compute_disposable_income(
     state: str,
     exp_data: dict,
     use_region_blend: bool = True,
-) -> dict:
+) -> DIResult:
     """
     Compute annual disposable income for an individual.
 
@@ -74,7 +216,8 @@ def compute_disposable_income(
 
     Returns
     -------
-    dict with full breakdown:
+    DIResult; its as_dict() (same keys as item access) gives the full
+    breakdown:
         'gross_income'       : float  — input salary
         'taxes'              : dict   — breakdown by type
         'total_tax'          : float  — sum of all taxes
@@ -116,58 +259,167 @@ def compute_disposable_income(
     di_fraction = disposable / gross_income if gross_income > 0 else 0.0
 
     # --- 4. Assemble Output ---
+    return DIResult(
+        gross_income=gross_income,
+        age=age,
+        state=state,
+        federal=taxes['federal'],
+        social_security=taxes['fica']['social_security'],
+        medicare=taxes['fica']['medicare'],
+        fica_total=taxes['fica']['total'],
+        state_tax=taxes['state'],
+        total_tax=total_tax,
+        effective_tax_rate=taxes['effective_total_rate'],
+        expenses=exp_result,
+        total_essential=total_essential,
+        total_all_expenses=exp_result['total_all'],
+        disposable=disposable,
+        di_fraction=di_fraction,
+        age_group=exp_result['age_group'],
+        region=exp_result['region'],
+        income_ratio=exp_result['income_ratio'],
+    )
+
+
+def compute_disposable_income_batch(
+    salaries,
+    ages,
+    states,
+    exp_data: dict,
+    use_region_blend: bool = True,
+    return_breakdown: bool = True,
+) -> dict:
+    """
+    Vectorized compute_disposable_income() over arrays of profiles.
+
+    Taxes and essential expenses are evaluated as whole-array NumPy
+    operations; nothing is rounded and no per-profile dicts are built.
+
+    Parameters
+    ----------
+    salaries : array_like
+        Annual gross salaries in USD.
+    ages : array_like of int
+        Ages in years.
+    states : array_like of str
+        Full U.S. state names.
+    exp_data : dict
+        Parsed expenditure data from data_loader.load_expenditure_data().
+    use_region_blend : bool
+        Blend age-group + regional BLS data (recommended, default True).
+    return_breakdown : bool
+        Passed to compute_essential_expenses_batch(). Use False for large
+        sweeps that only need totals; _unpack_batch_result() needs True.
+
+    Returns
+    -------
+    dict of np.ndarray (one entry per profile):
+        'gross_income', 'age', 'state', 'federal', 'social_security',
+        'medicare', 'fica_total', 'state_tax', 'total_tax',
+        'effective_tax_rate', 'total_essential', 'total_all_expenses',
+        'disposable_income', 'di_fraction'
+    plus 'expenses' : dict — compute_essential_expenses_batch() output.
+    """
+    salaries = np.asarray(salaries, dtype=np.float64)
+    ages = np.asarray(ages)
+    states = np.asarray(states)
+
+    if (salaries < 0).any():
+        raise ValueError(f"gross_income must be non-negative; got {salaries.min()}")
+    if ((ages < 0) | (ages > 120)).any():
+        bad = ages[(ages < 0) | (ages > 120)][0]
+        raise ValueError(f"age must be in [0, 120]; got {bad}")
+
+    # --- 1. Taxes ---
+    federal = compute_federal_tax_batch(salaries)
+    fica = compute_fica_batch(salaries)
+    state_tax = compute_state_tax_batch(salaries, states)
+    total_tax = federal + fica['total'] + state_tax
+
+    # --- 2. Essential Expenses ---
+    exp_result = compute_essential_expenses_batch(
+        salaries, ages, states, exp_data, use_region_blend=use_region_blend,
+        return_breakdown=return_breakdown,
+    )
+
+    # --- 3. Disposable Income ---
+    disposable = salaries - total_tax - exp_result['total_essential']
+    positive = salaries > 0
+
     return {
-        # Inputs
-        'gross_income': gross_income,
-        'age': age,
-        'state': state,
-
-        # Taxes
-        'taxes': {
-            'federal': taxes['federal'],
-            'social_security': taxes['fica']['social_security'],
-            'medicare': taxes['fica']['medicare'],
-            'fica_total': taxes['fica']['total'],
-            'state': taxes['state'],
-            'total': total_tax,
-        },
+        'gross_income': salaries,
+        'age': ages,
+        'state': states,
+        'federal': federal,
+        'social_security': fica['social_security'],
+        'medicare': fica['medicare'],
+        'fica_total': fica['total'],
+        'state_tax': state_tax,
         'total_tax': total_tax,
-        'effective_tax_rate': taxes['effective_total_rate'],
-
-        # Expenses
+        'effective_tax_rate': np.divide(
+            total_tax, salaries, out=np.zeros_like(salaries), where=positive
+        ),
         'expenses': exp_result,
-        'total_essential': total_essential,
+        'total_essential': exp_result['total_essential'],
         'total_all_expenses': exp_result['total_all'],
+        'disposable_income': disposable,
+        'di_fraction': np.divide(
+            disposable, salaries, out=np.zeros_like(salaries), where=positive
+        ),
+    }
 
-        # Disposable Income
-        'disposable_income': round(disposable, 2),
-        'di_fraction': round(di_fraction, 4),
-
-        # Demographics
-        'age_group': exp_result['age_group'],
-        'region': exp_result['region'],
-        'income_ratio': exp_result['income_ratio'],
-
-        # Model metadata
-        'assumptions': [
-            'Single filer, standard deduction ($15,000, IRS 2025)',
-            'Salary is sole income source',
-            'State rates: 2025 effective rates at income level (Tax Foundation)',
-            'BLS CES 2024 household expenditure, treated as individual',
-            'Engel curve: constant elasticity (power law) approximation of QUAIDS',
-            'No 401(k)/IRA deductions; voluntary savings treated as disposable',
-            'Static model: no career progression or inflation',
-        ],
+
+def _unpack_batch_result(batch: dict, i: int) -> DIResult:
+    """
+    Build the compute_disposable_income() result for row i of a batch result.
+    """
+    exp = batch['expenses']
+    per_cat = list(map(
+        CategoryResult,
+        exp['bls_age'][i].tolist(), exp['bls_region'][i].tolist(),
+        exp['bls_blended'][i].tolist(), exp['scaled'][i].tolist(),
+        exp['alpha'].tolist(), exp['beta'].tolist(), exp['essential'][i].tolist(),
+    ))
+    by_category = dict(zip(exp['categories'], per_cat))
+    exp_result = {
+        'total_essential': float(exp['total_essential'][i]),
+        'total_all': float(exp['total_all'][i]),
+        'by_category': by_category,
+        'age_group': exp['age_group'][i],
+        'region': exp['region'][i],
+        'avg_income_for_age_group': float(exp['avg_income_for_age_group'][i]),
+        'income_ratio': float(exp['income_ratio'][i]),
     }
 
+    return DIResult(
+        gross_income=float(batch['gross_income'][i]),
+        age=batch['age'][i].item(),
+        state=str(batch['state'][i]),
+        federal=float(batch['federal'][i]),
+        social_security=float(batch['social_security'][i]),
+        medicare=float(batch['medicare'][i]),
+        fica_total=float(batch['fica_total'][i]),
+        state_tax=float(batch['state_tax'][i]),
+        total_tax=float(batch['total_tax'][i]),
+        effective_tax_rate=float(batch['effective_tax_rate'][i]),
+        expenses=exp_result,
+        total_essential=exp_result['total_essential'],
+        total_all_expenses=exp_result['total_all'],
+        disposable=float(batch['disposable_income'][i]),
+        di_fraction=float(batch['di_fraction'][i]),
+        age_group=exp_result['age_group'],
+        region=exp_result['region'],
+        income_ratio=exp_result['income_ratio'],
+    )
+
 
-def format_result(result: dict, title: str = None) -> str:
+def format_result(result: DIResult, title: str = None) -> str:
     """
     Return a human-readable string summary of a disposable income result.
 
     Parameters
     ----------
-    result : dict
+    result : DIResult
         Output of compute_disposable_income().
     title : str, optional
         Optional title line (e.g., profile label).
@@ -182,68 +434,169 @@ def format_result(result: dict, title: str = None) -> str:
         lines.append(f"  {title}")
         lines.append(f"{'=' * 55}")
 
-    g = result['gross_income']
+    g = result.gross_income
     lines.append(f"  Gross Income:          ${g:>12,.0f}")
-    lines.append(f"  Age: {result['age']}   State: {result['state']}")
-    lines.append(f"  Age Group: {result['age_group']:<15}  Region: {result['region']}")
-    lines.append(f"  Income vs. age avg:    {result['income_ratio']:>8.2f}×")
+    lines.append(f"  Age: {result.age}   State: {result.state}")
+    lines.append(f"  Age Group: {result.age_group:<15}  Region: {result.region}")
+    lines.append(f"  Income vs. age avg:    {result.income_ratio:>8.2f}×")
     lines.append("")
     lines.append("  ── TAXES ──────────────────────────────")
-    taxes = result['taxes']
-    lines.append(f"    Federal income tax:  ${taxes['federal']:>10,.0f}  ({taxes['federal']/g:.1%})")
-    lines.append(f"    Social Security:     ${taxes['social_security']:>10,.0f}  ({taxes['social_security']/g:.1%})")
-    lines.append(f"    Medicare:            ${taxes['medicare']:>10,.0f}  ({taxes['medicare']/g:.1%})")
-    lines.append(f"    State ({result['state']:<12}):${taxes['state']:>10,.0f}  ({taxes['state']/g:.1%})")
+    lines.append(f"    Federal income tax:  ${result.federal:>10,.0f}  ({result.federal/g:.1%})")
+    lines.append(f"    Social Security:     ${result.social_security:>10,.0f}  ({result.social_security/g:.1%})")
+    lines.append(f"    Medicare:            ${result.medicare:>10,.0f}  ({result.medicare/g:.1%})")
+    lines.append(f"    State ({result.state:<12}):${result.state_tax:>10,.0f}  ({result.state_tax/g:.1%})")
     lines.append(f"    ─────────────────────────────────────")
-    lines.append(f"    TOTAL TAXES:         ${taxes['total']:>10,.0f}  ({result['effective_tax_rate']:.1%})")
+    lines.append(f"    TOTAL TAXES:         ${result.total_tax:>10,.0f}  ({result.effective_tax_rate:.1%})")
     lines.append("")
     lines.append("  ── ESSENTIAL EXPENSES ──────────────────")
 
-    by_cat = result['expenses']['by_category']
+    by_cat = result.expenses['by_category']
     for cat, info in by_cat.items():
-        if info['essential'] > 10:
-            lines.append(f"    {cat:<35} ${info['essential']:>8,.0f}  (α={info['alpha']:.0%})")
+        if info.essential > 10:
+            lines.append(f"    {cat:<35} ${info.essential:>8,.0f}  (α={info.alpha:.0%})")
     lines.append(f"    ─────────────────────────────────────")
-    lines.append(f"    TOTAL ESSENTIAL:     ${result['total_essential']:>10,.0f}  ({result['total_essential']/g:.1%})")
+    lines.append(f"    TOTAL ESSENTIAL:     ${result.total_essential:>10,.0f}  ({result.total_essential/g:.1%})")
     lines.append("")
     lines.append("  ── DISPOSABLE INCOME ───────────────────")
-    di = result['disposable_income']
-    lines.append(f"    DISPOSABLE INCOME:   ${di:>10,.0f}  ({result['di_fraction']:.1%} of gross)")
+    di = result.disposable
+    lines.append(f"    DISPOSABLE INCOME:   ${di:>10,.0f}  ({result.di_fraction:.1%} of gross)")
     if di < 0:
         lines.append("    ⚠ Negative DI: income below living cost threshold")
-    elif result['di_fraction'] < 0.10:
+    elif result.di_fraction < 0.10:
         lines.append("    ⚠ Very low DI fraction (<10% of income)")
 
     return "\n".join(lines)
 
 
+def summary_table(results: list) -> str:
+    """
+    Return a one-line-per-profile summary table for a list of results.
+
+    Parameters
+    ----------
+    results : list of DIResult
+        Outputs of run_all_profiles() (or labelled compute_disposable_income()).
+
+    Returns
+    -------
+    str
+    """
+    columns = ['label', 'age', 'gross_income', 'state', 'effective_tax_rate',
+               'total_essential', 'disposable', 'di_fraction']
+    df = pd.DataFrame({col: [getattr(r, col) for r in results] for col in columns})
+    df['total_essential'] = df['total_essential'] / df['gross_income']
+    df.columns = ['Profile', 'Age', 'Salary', 'State', 'Tax%', 'Ess%', 'DI', 'DI%']
+
+    dollars = '${:,.0f}'.format
+    percent = '{:.1%}'.format
+    return df.to_string(
+        index=False,
+        formatters={
+            'Salary': dollars, 'DI': dollars,
+            'Tax%': percent, 'Ess%': percent, 'DI%': percent,
+        },
+    )
+
+
 # ---------------------------------------------------------------------------
 # Run all 8 demographic profiles
 # ---------------------------------------------------------------------------
 
-def run_all_profiles(exp_data: dict) -> list:
+# Profiles per worker task in run_all_profiles()
+_PROFILE_CHUNK_SIZE = 4096
+
+
+def _profiles_to_array(profiles: list) -> np.ndarray:
+    """
+    Structured array with PROFILE_DTYPE's fields from a list of profile dicts.
+
+    Text fields are widened to the longest value so nothing is truncated,
+    and non-integer ages are rejected rather than silently cast.
+    """
+    from constants import PROFILE_DTYPE
+
+    rows = [(p['label'], p['age'], p['salary'], p['state'], p['archetype'])
+            for p in profiles]
+    for label, age, *_ in rows:
+        if age != int(age):
+            raise ValueError(f"Profile {label!r}: age {age} is not a whole number of years")
+
+    fields = []
+    for j, name in enumerate(PROFILE_DTYPE.names):
+        dtype = PROFILE_DTYPE[name]
+        if dtype.kind == 'U':
+            width = max([dtype.itemsize // 4] + [len(row[j]) for row in rows])
+            dtype = np.dtype(f'U{width}')
+        fields.append((name, dtype))
+    return np.array(rows, dtype=fields)
+
+
+def _compute_chunk(profiles: np.ndarray, exp_data: dict) -> list:
+    """Batch-compute one chunk of PROFILE_DTYPE rows and unpack it into DIResults."""
+    batch = compute_disposable_income_batch(
+        profiles['salary'], profiles['age'], profiles['state'], exp_data,
+    )
+
+    results = []
+    for i, (label, archetype) in enumerate(zip(profiles['label'].tolist(),
+                                               profiles['archetype'].tolist())):
+        result = _unpack_batch_result(batch, i)
+        result.label = label
+        result.archetype = archetype
+        results.append(result)
+    return results
+
+
+def run_all_profiles(
+    exp_data: dict,
+    profiles: list = None,
+    max_workers: int = None,
+) -> list:
     """
     Compute disposable income for all 8 demographic demonstration profiles.
 
+    Profiles are split into chunks of _PROFILE_CHUNK_SIZE; each chunk is
+    evaluated with one compute_disposable_income_batch() call, and
+    per-profile DIResults are only built afterwards. Chunks are
+    independent, so when there is more than one they run on a thread pool
+    (NumPy releases the GIL inside its array kernels). With Numba installed
+    the chunks run in turn instead: the parallel kernels already use every
+    core, and Numba's threading layers do not tolerate concurrent launches
+    from several Python threads.
+
+    Parameters
+    ----------
+    exp_data : dict
+        Parsed expenditure data from data_loader.load_expenditure_data().
+    profiles : np.ndarray or list of dict, optional
+        Structured array with constants.PROFILE_DTYPE, or dicts with 'label',
+        'age' (whole years), 'salary', 'state', 'archetype' keys; text fields
+        of the dicts are kept at full length.
+        Defaults to constants.DEMO_PROFILES_ARRAY.
+    max_workers : int, optional
+        Thread pool size (ThreadPoolExecutor default if None).
+
     Returns
     -------
-    list of dicts (one per profile, with 'label' and 'archetype' added)
+    list of DIResult (one per profile, with 'label' and 'archetype' set)
     """
-    from constants import DEMO_PROFILES
+    from constants import DEMO_PROFILES_ARRAY
 
-    results = []
-    for p in DEMO_PROFILES:
-        result = compute_disposable_income(
-            gross_income=p['salary'],
-            age=p['age'],
-            state=p['state'],
-            exp_data=exp_data,
-        )
-        result['label'] = p['label']
-        result['archetype'] = p['archetype']
-        results.append(result)
+    if profiles is None:
+        profiles = DEMO_PROFILES_ARRAY
+    elif not isinstance(profiles, np.ndarray):
+        profiles = _profiles_to_array(profiles)
 
-    return results
+    chunks = [
+        profiles[lo:lo + _PROFILE_CHUNK_SIZE]
+        for lo in range(0, len(profiles), _PROFILE_CHUNK_SIZE)
+    ]
+    if len(chunks) <= 1 or NUMBA_AVAILABLE:
+        parts = [_compute_chunk(chunk, exp_data) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            parts = list(ex.map(lambda chunk: _compute_chunk(chunk, exp_data), chunks))
+    return [result for part in parts for result in part]
 
 
 if __name__ == '__main__':
@@ -259,20 +612,11 @@ if __name__ == '__main__':
     print("\nRunning 8 demographic profiles...\n")
     results = run_all_profiles(exp_data)
     for r in results:
-        label = f"{r['label']}: Age {r['age']}, ${r['gross_income']:,.0f}, {r['state']} — {r['archetype']}"
+        label = f"{r.label}: Age {r.age}, ${r.gross_income:,.0f}, {r.state} — {r.archetype}"
         print(format_result(r, title=label))
 
     # Summary table
     print("\n" + "=" * 75)
     print("SUMMARY TABLE")
     print("=" * 75)
-    print(f"{'Profile':<5} {'Age':>4} {'Salary':>10} {'State':<12} "
-          f"{'Tax%':>6} {'Ess%':>6} {'DI':>10} {'DI%':>6}")
-    print("-" * 75)
-    for r in results:
-        g = r['gross_income']
-        print(f"{r['label']:<5} {r['age']:>4} ${g:>9,.0f} {r['state']:<12} "
-              f"{r['effective_tax_rate']:>5.1%} "
-              f"{r['total_essential']/g:>5.1%} "
-              f"${r['disposable_income']:>9,.0f} "
-              f"{r['di_fraction']:>5.1%}")
+    print(summary_table(results))
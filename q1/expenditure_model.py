@@ -46,28 +46,44 @@ BLS CPS Earnings Tables (2024). bls.gov/cps/earnings.htm
 OECD (2024). Household Disposable Income. oecd.org
 """
 
-import math
+import functools
+from bisect import bisect_right
+from dataclasses import dataclass
+from math import exp, log
+import numpy as np
 from constants import (
+    AVG_INCOME_BY_AGE,   # kept for documentation; computation uses BLS CES income
+    AGE_BINS,
+    AGE_GROUP_NAMES,
     ESSENTIAL_FRACTIONS,
     INCOME_ELASTICITY,
-    AVG_INCOME_BY_AGE,   # kept for documentation; computation uses BLS CES income
-    STATE_TO_REGION,
+    REGIONS,
+    REGION_ID,
+    STATE_ID,
+    REGION_OF,
 )
+from jit import njit, prange, NUMBA_AVAILABLE, aot_kernels
 
 
 # ---------------------------------------------------------------------------
 # Age group mapping
 # ---------------------------------------------------------------------------
 
-_AGE_BREAKS = [
-    (0,  24,  'Under 25'),
-    (25, 34,  '25-34'),
-    (35, 44,  '35-44'),
-    (45, 54,  '45-54'),
-    (55, 64,  '55-64'),
-    (65, 74,  '65-74'),
-    (75, 999, '75 and older'),
-]
+# Plain-Python copies of AGE_BINS / AGE_GROUP_NAMES for scalar lookups
+_AGE_BIN_EDGES = tuple(AGE_BINS.tolist())
+_AGE_GROUP_LABELS = tuple(AGE_GROUP_NAMES.tolist())
+
+
+def _age_group_ids(ages) -> np.ndarray:
+    """Index into AGE_GROUP_NAMES for each age (one np.searchsorted call)."""
+    ages = np.asarray(ages)
+    # Written as a negated in-range test so NaN is rejected too
+    out_of_range = ~((ages >= 0) & (ages <= 999))
+    if out_of_range.any():
+        raise ValueError(
+            f"Age {ages[out_of_range].flat[0]} is out of expected range (0–999)"
+        )
+    return np.searchsorted(AGE_BINS, ages, side='right')
 
 
 def get_age_group(age: int) -> str:
@@ -83,11 +99,32 @@ def get_age_group(age: int) -> str:
     -------
     str
         Age group label matching BLS CES data (e.g., '25-34').
+
+    Raises
+    ------
+    ValueError
+        If age is outside 0–999 or NaN.
+    """
+    if not 0 <= age <= 999:
+        raise ValueError(f"Age {age} is out of expected range (0–999)")
+    return _AGE_GROUP_LABELS[bisect_right(_AGE_BIN_EDGES, age)]
+
+
+def age_to_group(ages) -> np.ndarray:
+    """
+    Vectorized get_age_group(): map an array of ages to BLS CES labels.
+
+    Parameters
+    ----------
+    ages : array_like of int
+        Ages in years.
+
+    Returns
+    -------
+    np.ndarray of str
+        Age group label for each age, same shape as the input.
     """
-    for lo, hi, label in _AGE_BREAKS:
-        if lo <= age <= hi:
-            return label
-    raise ValueError(f"Age {age} is out of expected range (0–999)")
+    return AGE_GROUP_NAMES[_age_group_ids(ages)]
 
 
 def get_region_for_state(state: str) -> str:
@@ -104,12 +141,32 @@ def get_region_for_state(state: str) -> str:
     str
         BLS region label: 'Northeast', 'Midwest', 'South', or 'West'.
     """
-    if state not in STATE_TO_REGION:
+    try:
+        state_id = STATE_ID[state]
+    except KeyError:
         raise ValueError(
             f"State '{state}' not found in STATE_TO_REGION. "
             f"Check constants.py for supported states."
-        )
-    return STATE_TO_REGION[state]
+        ) from None
+    return REGIONS[REGION_OF[state_id]]
+
+
+def state_to_region_ids(states) -> np.ndarray:
+    """
+    Vectorized get_region_for_state(): map state names to indices into REGIONS.
+
+    Each distinct state is looked up once; the per-profile mapping is a single
+    gather from the REGION_OF table.
+    """
+    unique_states, inverse = np.unique(np.asarray(states), return_inverse=True)
+    try:
+        state_ids = np.array([STATE_ID[s] for s in unique_states], dtype=np.intp)
+    except KeyError as err:
+        raise ValueError(
+            f"State '{err.args[0]}' not found in STATE_TO_REGION. "
+            f"Check constants.py for supported states."
+        ) from None
+    return REGION_OF[state_ids[inverse.ravel()]]
 
 
 # ---------------------------------------------------------------------------
@@ -151,19 +208,184 @@ def _scale_expenditure(
     if avg_income <= 0 or salary <= 0:
         return bls_amount
     ratio = salary / avg_income
-    return bls_amount * (ratio ** beta)
+    return bls_amount * exp(beta * log(ratio))
+
+
+@njit(cache=True, fastmath=True)
+def _essential_kernel(age_bls, reg_bls, beta, alpha, salary, avg_income,
+                      w_age, w_reg):
+    """
+    Blend, Engel-scale and apply essential fractions for one profile.
+
+    Written as a scalar loop over categories (rather than array expressions)
+    so that, under Numba, it compiles to a single fused loop.
+
+    Returns
+    -------
+    (total_essential, total_all, scaled, essential)
+    """
+    # ratio**beta as exp(beta * log(ratio)); log(ratio) is shared by all categories
+    if avg_income > 0 and salary > 0:
+        log_ratio = log(salary / avg_income)
+    else:
+        log_ratio = 0.0
+    k = age_bls.shape[0]
+    scaled = np.empty(k)
+    essential = np.empty(k)
+    total_essential = 0.0
+    total_all = 0.0
+    for i in range(k):
+        s = (w_age * age_bls[i] + w_reg * reg_bls[i]) * exp(beta[i] * log_ratio)
+        e = s * alpha[i]
+        scaled[i] = s
+        essential[i] = e
+        total_all += s
+        total_essential += e
+    return total_essential, total_all, scaled, essential
+
+
+@njit(cache=True, fastmath=True)
+def _essential_totals_kernel(age_bls, reg_bls, beta, alpha, salary, avg_income,
+                             w_age, w_reg):
+    """
+    _essential_kernel() without the per-category vectors: one accumulator
+    pass, no allocation.
+
+    Returns
+    -------
+    (total_essential, total_all)
+    """
+    if avg_income > 0 and salary > 0:
+        log_ratio = log(salary / avg_income)
+    else:
+        log_ratio = 0.0
+    total_essential = 0.0
+    total_all = 0.0
+    for i in range(age_bls.shape[0]):
+        s = (w_age * age_bls[i] + w_reg * reg_bls[i]) * exp(beta[i] * log_ratio)
+        total_all += s
+        total_essential += s * alpha[i]
+    return total_essential, total_all
+
+
+# Scalar call sites use the AOT-compiled kernel when it has been built
+_essential_totals_scalar = (
+    aot_kernels.essential_totals if aot_kernels else _essential_totals_kernel
+)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _score_population(salaries, age_idx, reg_idx, age_bls_mat, reg_bls_mat,
+                      beta, alpha, avg_income_vec, w_age, w_reg,
+                      out_essential, out_all):
+    """
+    _essential_totals_kernel() for every profile, in parallel over profiles.
+
+    age_idx / reg_idx select each profile's rows of the packed BLS matrices
+    (see _bls_tables); totals are written into out_essential / out_all.
+    """
+    for i in prange(salaries.size):
+        a = age_idx[i]
+        out_essential[i], out_all[i] = _essential_totals_kernel(
+            age_bls_mat[a], reg_bls_mat[reg_idx[i]], beta, alpha,
+            salaries[i], avg_income_vec[a], w_age, w_reg,
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_vectors(categories: tuple) -> tuple:
+    """
+    (beta, alpha) float64 vectors aligned with the given category order.
+
+    Categories missing from the tables get beta = 1.0 (proportional to
+    income) and alpha = 0.0 (fully discretionary). The arrays are shared
+    between calls and marked read-only.
+    """
+    beta = np.array([INCOME_ELASTICITY.get(c, 1.0) for c in categories])
+    alpha = np.array([ESSENTIAL_FRACTIONS.get(c, 0.0) for c in categories])
+    beta.flags.writeable = False
+    alpha.flags.writeable = False
+    return beta, alpha
+
+
+# Row of the age-group tables for each age-group label
+_AGE_ROW = {str(group): i for i, group in enumerate(AGE_GROUP_NAMES)}
+
+
+def _bls_tables(exp_data: dict) -> tuple:
+    """
+    Dense, row-major lookup tables for exp_data.
+
+    Returns
+    -------
+    (age_bls_mat, reg_bls_mat, avg_income_vec):
+        age_bls_mat    : (n_age_groups, k) BLS baselines, rows in AGE_GROUP_NAMES order
+        reg_bls_mat    : (n_regions, k) BLS baselines, rows in REGIONS order
+        avg_income_vec : (n_age_groups,) Engel reference income per age group
+
+    Row order matches _age_group_ids() and REGION_OF, so integer group and
+    region ids index the matrices directly. load_expenditure_data() builds
+    these once per file; a dict with only the 'by_age' / 'by_region' mappings
+    gets them built from those on each call.
+    """
+    age_bls_mat = exp_data.get('age_bls_mat')
+    if age_bls_mat is not None:
+        return age_bls_mat, exp_data['reg_bls_mat'], exp_data['avg_income_vec']
+
+    categories = exp_data['categories']
+    by_age, by_region = exp_data['by_age'], exp_data['by_region']
+    age_bls_mat = np.array([
+        [by_age.get(group, {}).get(cat, 0.0) for cat in categories]
+        for group in AGE_GROUP_NAMES
+    ], dtype=np.float64).reshape(len(AGE_GROUP_NAMES), len(categories))
+    reg_bls_mat = np.array([
+        [by_region.get(region, {}).get(cat, 0.0) for cat in categories]
+        for region in REGIONS
+    ], dtype=np.float64).reshape(len(REGIONS), len(categories))
+    # BLS CES mean household income is the Engel reference (see data_loader)
+    avg_income_vec = np.array([
+        exp_data['mean_income_by_age'].get(group, AVG_INCOME_BY_AGE[group])
+        for group in AGE_GROUP_NAMES
+    ], dtype=np.float64)
+    return age_bls_mat, reg_bls_mat, avg_income_vec
 
 
 # ---------------------------------------------------------------------------
 # Main expenditure computation
 # ---------------------------------------------------------------------------
 
+@dataclass(slots=True)
+class CategoryResult:
+    """
+    One category's entry in compute_essential_expenses()['by_category'].
+
+    Item access (info['essential'], info.get('essential', 0)) reads the
+    matching field so dict-style callers keep working.
+    """
+    bls_age: float
+    bls_region: float
+    bls_blended: float
+    scaled: float
+    alpha: float
+    beta: float
+    essential: float
+
+    def __getitem__(self, key: str) -> float:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+
 def compute_essential_expenses(
     salary: float,
     age: int,
     state: str,
     exp_data: dict,
     use_region_blend: bool = True,
+    return_breakdown: bool = True,
 ) -> dict:
     """
     Estimate annual essential (non-discretionary) expenses.
@@ -189,13 +411,17 @@ def compute_essential_expenses(
     use_region_blend : bool
         If True, blend age-group + regional data (recommended).
         If False, use age-group data only.
+    return_breakdown : bool
+        If False, skip building 'by_category' (callers that only need the
+        totals, e.g. salary sweeps).
 
     Returns
     -------
     dict with keys:
-        'total_essential'         : float — total essential expenses (USD)
+        'total_essential'         : float — total essential expenses (USD, unrounded)
         'total_all'               : float — total expenses (essential + discret.)
-        'by_category'             : dict  — per-category breakdown
+        'by_category'             : dict  — category → CategoryResult
+                                            (only if return_breakdown)
         'age_group'               : str
         'region'                  : str
         'avg_income_for_age_group': float
@@ -204,65 +430,150 @@ def compute_essential_expenses(
     age_group = get_age_group(age)
     region = get_region_for_state(state)
 
-    # Use BLS CES mean household income for this age group as the Engel
-    # scaling reference point. This is internally consistent: the BLS CES
-    # expenditure data is calibrated to this same survey's income measure.
-    # BLS CPS individual earnings (AVG_INCOME_BY_AGE) are preserved in
-    # constants.py for documentation; the CES household income is used here
-    # because it represents the actual income at which BLS CES expenditures
-    # were observed.
-    avg_income = exp_data['mean_income_by_age'].get(age_group, AVG_INCOME_BY_AGE[age_group])
-
-    age_data = exp_data['by_age'][age_group]
-    region_data = exp_data['by_region'][region]
+    age_bls_mat, reg_bls_mat, avg_income_vec = _bls_tables(exp_data)
+    age_row = _AGE_ROW[age_group]
+    avg_income = float(avg_income_vec[age_row])
+    age_bls = age_bls_mat[age_row]
+    reg_bls = reg_bls_mat[REGION_ID[region]]
 
     # Blend weights
     w_age = 0.6 if use_region_blend else 1.0
     w_reg = 0.4 if use_region_blend else 0.0
 
-    categories = exp_data['categories']
-    by_category = {}
-    total_essential = 0.0
-    total_all = 0.0
-
-    for cat in categories:
-        age_bls = age_data.get(cat, 0.0)
-        reg_bls = region_data.get(cat, 0.0)
+    beta, alpha = _cached_vectors(tuple(exp_data['categories']))
+    args = (age_bls, reg_bls, beta, alpha,
+            float(salary), float(avg_income), w_age, w_reg)
+    if return_breakdown:
+        total_essential, total_all, scaled, essential = _essential_kernel(*args)
+    else:
+        total_essential, total_all = _essential_totals_scalar(*args)
+
+    result = {
+        'total_essential': float(total_essential),
+        'total_all': float(total_all),
+        'age_group': age_group,
+        'region': region,
+        'avg_income_for_age_group': avg_income,
+        'income_ratio': salary / avg_income if avg_income > 0 else 1.0,
+    }
+    if return_breakdown:
+        bls_blended = w_age * age_bls + w_reg * reg_bls
+        per_cat = list(map(
+            CategoryResult,
+            age_bls.tolist(), reg_bls.tolist(), bls_blended.tolist(),
+            scaled.tolist(), alpha.tolist(), beta.tolist(), essential.tolist(),
+        ))
+        result['by_category'] = dict(zip(exp_data['categories'], per_cat))
+    return result
+
+
+def compute_essential_expenses_batch(
+    salaries,
+    ages,
+    states,
+    exp_data: dict,
+    use_region_blend: bool = True,
+    return_breakdown: bool = True,
+) -> dict:
+    """
+    Vectorized compute_essential_expenses() over arrays of profiles.
 
-        # Blended BLS baseline
-        bls_base = w_age * age_bls + w_reg * reg_bls
+    BLS baselines are gathered into (n_profiles, n_categories) matrices and
+    the Engel scaling is applied to all profiles and categories at once.
+    With return_breakdown=False and Numba available, only the totals are
+    computed, by the parallel _score_population kernel.
 
-        # Engel curve scaling
-        beta = INCOME_ELASTICITY.get(cat, 1.0)
-        scaled = _scale_expenditure(bls_base, salary, avg_income, beta)
+    Parameters
+    ----------
+    salaries : array_like
+        Annual gross incomes in USD.
+    ages : array_like of int
+        Ages in years.
+    states : array_like of str
+        Full state names.
+    exp_data : dict
+        Parsed from data_loader.load_expenditure_data().
+    use_region_blend : bool
+        If True, blend age-group + regional data (recommended).
+    return_breakdown : bool
+        If False, return only the totals and per-profile metadata.
 
-        # Essential fraction
-        alpha = ESSENTIAL_FRACTIONS.get(cat, 0.0)
-        essential = scaled * alpha
+    Returns
+    -------
+    dict with keys:
+        'total_essential', 'total_all'      : np.ndarray, shape (n,)
+        'bls_age', 'bls_region', 'bls_blended',
+        'scaled', 'essential'               : np.ndarray, shape (n, k)
+        'alpha', 'beta'                     : np.ndarray, shape (k,)
+        'categories'                        : list[str], length k
+                                              (above only if return_breakdown)
+        'age_group', 'region'               : list[str], length n
+        'avg_income_for_age_group',
+        'income_ratio'                      : np.ndarray, shape (n,)
+    """
+    salaries = np.asarray(salaries, dtype=np.float64)
+    group_ids = _age_group_ids(ages)
+    age_groups = AGE_GROUP_NAMES[group_ids].tolist()
+    region_ids = state_to_region_ids(states)
+    regions = [REGIONS[r] for r in region_ids]
 
-        by_category[cat] = {
-            'bls_age':   age_bls,
-            'bls_region': reg_bls,
-            'bls_blended': bls_base,
-            'scaled':    scaled,
-            'alpha':     alpha,
-            'beta':      beta,
-            'essential': essential,
-        }
+    age_bls_mat, reg_bls_mat, avg_income_vec = _bls_tables(exp_data)
+    avg_income = avg_income_vec[group_ids]
 
-        total_essential += essential
-        total_all += scaled
+    categories = exp_data['categories']
+    beta, alpha = _cached_vectors(tuple(categories))
+    w_age = 0.6 if use_region_blend else 1.0
+    w_reg = 0.4 if use_region_blend else 0.0
 
-    return {
-        'total_essential': round(total_essential, 2),
-        'total_all': round(total_all, 2),
-        'by_category': by_category,
-        'age_group': age_group,
-        'region': region,
+    # Same guards as _scale_expenditure: no scaling for non-positive inputs
+    income_ratio = np.divide(
+        salaries, avg_income, out=np.ones_like(salaries), where=avg_income > 0
+    )
+    result = {
+        'age_group': age_groups,
+        'region': regions,
         'avg_income_for_age_group': avg_income,
-        'income_ratio': salary / avg_income if avg_income > 0 else 1.0,
+        'income_ratio': income_ratio,
     }
 
+    if not return_breakdown and NUMBA_AVAILABLE:
+        flat = np.ascontiguousarray(salaries).ravel()
+        total_essential = np.empty_like(flat)
+        total_all = np.empty_like(flat)
+        _score_population(
+            flat, group_ids.ravel(), region_ids.ravel(),
+            age_bls_mat, reg_bls_mat,
+            beta, alpha, avg_income_vec, w_age, w_reg,
+            total_essential, total_all,
+        )
+        result['total_essential'] = total_essential.reshape(salaries.shape)
+        result['total_all'] = total_all.reshape(salaries.shape)
+        return result
+
+    # Gather (n, k) baselines, one row per profile
+    bls_age = age_bls_mat[group_ids]
+    bls_region = reg_bls_mat[region_ids]
+    bls_blended = w_age * bls_age + w_reg * bls_region
+
+    scale_ratio = np.where(salaries > 0, income_ratio, 1.0)
+    scaled = bls_blended * np.exp(beta[None, :] * np.log(scale_ratio)[:, None])
+    essential = scaled * alpha
+
+    result['total_essential'] = essential.sum(axis=1)
+    result['total_all'] = scaled.sum(axis=1)
+    if return_breakdown:
+        result.update({
+            'bls_age': bls_age,
+            'bls_region': bls_region,
+            'bls_blended': bls_blended,
+            'scaled': scaled,
+            'essential': essential,
+            'alpha': alpha,
+            'beta': beta,
+            'categories': categories,
+        })
+    return result
+
 
 def get_essential_breakdown(exp_result: dict) -> dict:
     """
@@ -278,7 +589,7 @@ def get_essential_breakdown(exp_result: dict) -> dict:
     dict mapping category name → essential USD amount.
     """
     return {
-        cat: info['essential']
+        cat: info.essential
         for cat, info in exp_result['by_category'].items()
     }
 
@@ -320,7 +631,8 @@ def validate_expenditure_module(exp_data: dict) -> None:
     print(f"  Food at 2× income (beta=0.55): ${scaled_hi:,.0f} vs BLS ${bls_amt:,.0f} ✓")
 
     # Compute for a profile at avg income → essential ≈ reasonable fraction
-    result = compute_essential_expenses(avg_inc, 30, 'California', exp_data)
+    result = compute_essential_expenses(avg_inc, 30, 'California', exp_data,
+                                        return_breakdown=False)
     ess_frac = result['total_essential'] / avg_inc
     print(f"\nProfile: age=30, salary=$62k, CA")
     print(f"  Total essential: ${result['total_essential']:,.0f}")
@@ -328,4 +640,50 @@ def validate_expenditure_module(exp_data: dict) -> None:
     print(f"  Essential / salary: {ess_frac:.1%}  [expected: 40-70%]")
     assert 0.30 < ess_frac < 0.90, f"Essential fraction {ess_frac:.2%} outside 30-90%"
 
+    # Batch paths (NumPy gather, _score_population) agree with the scalar one
+    profiles = [
+        (salary, age, state)
+        for age in (18, 25, 30, 40, 50, 60, 70, 80)
+        for state in STATE_ID
+        for salary in (0.0, 15_000.0, 45_000.0, 80_000.0, 150_000.0, 400_000.0)
+    ]
+    salaries, ages, states = (np.array(col) for col in zip(*profiles))
+    scalar = np.array([
+        [r['total_essential'], r['total_all']]
+        for r in (compute_essential_expenses(*p, exp_data, return_breakdown=False)
+                  for p in profiles)
+    ])
+    detailed = [compute_essential_expenses(*p, exp_data) for p in profiles]
+
+    def _agrees(total_essential, total_all):
+        return (np.allclose(total_essential, scalar[:, 0], rtol=1e-9, atol=1e-6)
+                and np.allclose(total_all, scalar[:, 1], rtol=1e-9, atol=1e-6))
+
+    assert _agrees([r['total_essential'] for r in detailed],
+                   [r['total_all'] for r in detailed]), "scalar breakdown totals"
+    assert np.allclose(
+        [sum(c.essential for c in r['by_category'].values()) for r in detailed],
+        scalar[:, 0], rtol=1e-9, atol=1e-6,
+    ), "by_category does not sum to total_essential"
+    for return_breakdown in (True, False):
+        batch = compute_essential_expenses_batch(
+            salaries, ages, states, exp_data, return_breakdown=return_breakdown
+        )
+        assert _agrees(batch['total_essential'], batch['total_all']), \
+            f"batch (return_breakdown={return_breakdown})"
+
+    # _score_population directly (the Numba kernel, or plain Python without it)
+    age_bls_mat, reg_bls_mat, avg_income_vec = _bls_tables(exp_data)
+    beta, alpha = _cached_vectors(tuple(exp_data['categories']))
+    total_essential = np.empty_like(salaries)
+    total_all = np.empty_like(salaries)
+    _score_population(
+        salaries, _age_group_ids(ages), state_to_region_ids(states),
+        age_bls_mat, reg_bls_mat, beta, alpha, avg_income_vec, 0.6, 0.4,
+        total_essential, total_all,
+    )
+    assert _agrees(total_essential, total_all), "_score_population"
+    print(f"Batch vs scalar ({len(profiles)} profiles, "
+          f"Numba={'on' if NUMBA_AVAILABLE else 'off'}): OK ✓")
+
     print("\nExpenditure module validation PASSED ✓")
@@ -0,0 +1,41 @@
+"""
+jit.py — M3 Challenge 2026 Q1
+
+Optional Numba acceleration for the numeric kernels.
+
+Numba is not required to run the model. When it is not installed, `njit`
+becomes a no-op decorator and `prange` falls back to `range`, so decorated
+kernels run as ordinary Python/NumPy code with identical results.
+
+If the ahead-of-time extension built by aot_compile.py (m3_kernels) is
+importable, `aot_kernels` is that module; scalar call sites use its
+precompiled kernels and skip JIT compilation. Otherwise it is None. Model
+constants are kernel arguments, so a build never goes stale when
+constants.py changes; a build whose exported signatures predate the current
+AOT_ABI_VERSION is ignored.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Bump whenever an exported kernel signature in aot_compile.py changes
+AOT_ABI_VERSION = 2
+
+try:
+    import m3_kernels as aot_kernels
+except ImportError:
+    aot_kernels = None
+else:
+    _abi_version = getattr(aot_kernels, 'abi_version', None)
+    if _abi_version is None or _abi_version() != AOT_ABI_VERSION:
+        aot_kernels = None
@@ -11,26 +11,72 @@ SSA 2025 Announcement            : Social Security wage base $176,100
 Tax Foundation 2025 State Data   : State effective rate schedules
 """
 
-import math
+import functools
+import numpy as np
 from constants import (
-    STANDARD_DEDUCTION_SINGLE,
-    FEDERAL_BRACKETS_SINGLE_2025,
+    RATE_DEN,
+    STANDARD_DEDUCTION_CENTS,
+    BRACKET_EDGES_CENTS, BRACKET_W_CENTS, BRACKET_RATE_BP,
+    SS_RATE_BP, SS_WAGE_BASE_CENTS,
+    MEDICARE_RATE_BP, MEDICARE_SURCHARGE_RATE_BP, MEDICARE_SURCHARGE_THRESHOLD_CENTS,
     SS_RATE, SS_WAGE_BASE,
-    MEDICARE_RATE, MEDICARE_SURCHARGE_RATE, MEDICARE_SURCHARGE_THRESHOLD,
-    STATE_TAX_SCHEDULE,
+    STATE_TAX_SCHEDULE, STATE_TAX_SCHEDULE_ARR, FLAT_STATE_RATE, ZERO_TAX_STATES,
+    STATE_TAX_ROW, STATE_TAX_N, STATE_TAX_X_PAD, STATE_TAX_Y_PAD,
 )
+from jit import njit, prange, NUMBA_AVAILABLE, aot_kernels
 
 
 # ---------------------------------------------------------------------------
 # Federal Income Tax
 # ---------------------------------------------------------------------------
 
+def _to_cents(gross_income: float) -> int:
+    """Dollar amount → nearest whole cent (int)."""
+    return int(round(float(gross_income) * 100))
+
+
+def _to_cents_array(gross_incomes) -> np.ndarray:
+    """Dollar amounts → nearest whole cents (int64 array)."""
+    return np.rint(np.asarray(gross_incomes, dtype=np.float64) * 100).astype(np.int64)
+
+
+@njit(cache=True)
+def _fed_tax_cents(ti, edges, bp, rate_den):
+    """Branchless bracket tax on taxable income ti, all in int cents (see constants.py)."""
+    acc = 0
+    for k in range(bp.size):
+        acc += max(0, min(ti, edges[k + 1]) - edges[k]) * bp[k]
+    return (acc + rate_den // 2) // rate_den
+
+
+# Scalar call sites use the AOT-compiled kernel when it has been built
+_fed_tax_cents_scalar = aot_kernels.fed_tax_cents if aot_kernels else _fed_tax_cents
+
+
+@njit(parallel=True, cache=True)
+def _fed_tax_vec(ti, edges, bp, rate_den):
+    """_fed_tax_cents over a 1-D array of taxable incomes, in parallel."""
+    out = np.empty_like(ti)
+    for i in prange(ti.size):
+        out[i] = _fed_tax_cents(ti[i], edges, bp, rate_den)
+    return out
+
+
+@functools.lru_cache(maxsize=4096)
 def compute_federal_tax(gross_income: float) -> float:
     """
     Compute 2025 federal income tax for a single filer using standard deduction.
 
     Taxable income = max(0, gross_income - standard_deduction)
-    Progressive brackets applied incrementally.
+    Progressive brackets are evaluated branchlessly: every bracket
+    contributes its rate times the slice of taxable income inside it
+    (zero for brackets above the income). The sum is exact in integer cents
+    and rounded half-up to the cent once.
+
+    Results are memoized (lru_cache) keyed on gross_income alone. The
+    brackets and deduction are passed to the kernels as arguments, so they
+    always see this module's constants; after reloading constants.py, reload
+    this module too (which also starts a fresh cache).
 
     Parameters
     ----------
@@ -50,25 +96,50 @@ def compute_federal_tax(gross_income: float) -> float:
       Total = $5,161.50
     (IRS example: ~$5,162)
     """
-    taxable = max(0.0, gross_income - STANDARD_DEDUCTION_SINGLE)
+    return _federal_tax_cents(_to_cents(gross_income)) / 100
 
-    tax = 0.0
-    prev_limit = 0.0
-    for upper, rate in FEDERAL_BRACKETS_SINGLE_2025:
-        if upper is None:
-            # Top bracket — no ceiling
-            bracket_income = max(0.0, taxable - prev_limit)
-        else:
-            bracket_income = max(0.0, min(taxable, upper) - prev_limit)
 
-        tax += bracket_income * rate
+def _federal_tax_cents(gross_cents: int) -> int:
+    """compute_federal_tax() in int cents, without memoization."""
+    taxable = max(0, gross_cents - STANDARD_DEDUCTION_CENTS)
+    return int(_fed_tax_cents_scalar(taxable, BRACKET_EDGES_CENTS, BRACKET_RATE_BP, RATE_DEN))
 
-        if upper is not None and taxable <= upper:
-            break
-        if upper is not None:
-            prev_limit = upper
 
-    return round(tax, 2)
+def compute_federal_tax_batch(gross_incomes) -> np.ndarray:
+    """
+    Vectorized compute_federal_tax() over an array of gross incomes.
+
+    Incomes are converted to int64 cents. With Numba, the parallel
+    _fed_tax_vec kernel applies the scalar bracket loop to each income.
+    Without it, the same sum is one 2-D integer op: the slice of taxable
+    income falling in each bracket is clip(taxable - lo, 0, width), weighted
+    by the bracket rate and summed. Matches compute_federal_tax() exactly.
+
+    Parameters
+    ----------
+    gross_incomes : array_like
+        Annual gross salaries in USD.
+
+    Returns
+    -------
+    np.ndarray
+        Federal income tax owed in USD, same shape as the input.
+    """
+    taxable = np.maximum(_to_cents_array(gross_incomes) - STANDARD_DEDUCTION_CENTS, 0)
+    if NUMBA_AVAILABLE:
+        flat = np.ascontiguousarray(taxable).ravel()
+        tax = _fed_tax_vec(
+            flat, BRACKET_EDGES_CENTS, BRACKET_RATE_BP, RATE_DEN
+        ).reshape(taxable.shape)
+    else:
+        tax = _fed_tax_cents_np(taxable)
+    return tax / 100
+
+
+def _fed_tax_cents_np(taxable: np.ndarray) -> np.ndarray:
+    """NumPy form of _fed_tax_cents over an array of taxable int cents."""
+    in_bracket = np.clip(taxable[..., None] - BRACKET_EDGES_CENTS[:-1], 0, BRACKET_W_CENTS)
+    return (in_bracket @ BRACKET_RATE_BP + RATE_DEN // 2) // RATE_DEN
 
 
 def compute_effective_federal_rate(gross_income: float) -> float:
@@ -82,10 +153,48 @@ def compute_effective_federal_rate(gross_income: float) -> float:
 # FICA Payroll Taxes
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _fica_cents(g, ss_base, ss_bp, med_bp, sur_threshold, sur_bp, rate_den):
+    """
+    FICA components for an income of g int cents, each rounded half-up.
+
+    The wage base, threshold (int cents) and rates (1/rate_den) are
+    arguments rather than globals so compiled kernels never hold a stale
+    copy of constants.py; callers pass _FICA_PARAMS.
+
+    Returns
+    -------
+    (social_security, medicare_base, medicare_surcharge) in int cents
+    """
+    half = rate_den // 2
+    # Social Security: 6.2% on first $176,100
+    ss_wages = g if g < ss_base else ss_base
+    social_security = (ss_wages * ss_bp + half) // rate_den
+    # Medicare: 1.45% on all wages, plus 0.9% on wages above $200,000 (single)
+    medicare_base = (g * med_bp + half) // rate_den
+    surcharge_wages = g - sur_threshold
+    if surcharge_wages < 0:
+        surcharge_wages = 0
+    medicare_surcharge = (surcharge_wages * sur_bp + half) // rate_den
+    return social_security, medicare_base, medicare_surcharge
+
+
+_FICA_PARAMS = (
+    SS_WAGE_BASE_CENTS, SS_RATE_BP,
+    MEDICARE_RATE_BP, MEDICARE_SURCHARGE_THRESHOLD_CENTS, MEDICARE_SURCHARGE_RATE_BP,
+    RATE_DEN,
+)
+
+_fica_cents_scalar = aot_kernels.fica_cents if aot_kernels else _fica_cents
+
+
 def compute_fica(gross_income: float) -> dict:
     """
     Compute Social Security and Medicare payroll taxes (employee share).
 
+    Each component is computed exactly in integer cents; sums are of
+    whole-cent amounts.
+
     Parameters
     ----------
     gross_income : float
@@ -98,58 +207,68 @@ def compute_fica(gross_income: float) -> dict:
         'medicare'         : float — Medicare tax owed (base + surcharge)
         'total'            : float — sum of both
     """
-    # Social Security: 6.2% on first $176,100
-    ss_taxable = min(gross_income, SS_WAGE_BASE)
-    social_security = round(ss_taxable * SS_RATE, 2)
-
-    # Medicare: 1.45% on all wages
-    medicare_base = round(gross_income * MEDICARE_RATE, 2)
-    # Additional 0.9% surcharge on wages above $200,000 (single filer)
-    medicare_surcharge = 0.0
-    if gross_income > MEDICARE_SURCHARGE_THRESHOLD:
-        medicare_surcharge = round(
-            (gross_income - MEDICARE_SURCHARGE_THRESHOLD) * MEDICARE_SURCHARGE_RATE, 2
-        )
+    return _fica_dollars(*_fica_cents_scalar(_to_cents(gross_income), *_FICA_PARAMS))
 
-    medicare_total = round(medicare_base + medicare_surcharge, 2)
 
+def _fica_dollars(social_security, medicare_base, medicare_surcharge) -> dict:
+    """compute_fica()-style dict from int-cent components (scalars or arrays)."""
+    medicare_total = medicare_base + medicare_surcharge
     return {
-        'social_security': social_security,
-        'medicare': medicare_total,
-        'medicare_base': medicare_base,
-        'medicare_surcharge': medicare_surcharge,
-        'total': round(social_security + medicare_total, 2),
+        'social_security': social_security / 100,
+        'medicare': medicare_total / 100,
+        'medicare_base': medicare_base / 100,
+        'medicare_surcharge': medicare_surcharge / 100,
+        'total': (social_security + medicare_total) / 100,
     }
 
 
-# ---------------------------------------------------------------------------
-# State Income Tax
-# ---------------------------------------------------------------------------
+@njit(parallel=True, cache=True)
+def _fica_batch(g, ss_base, ss_bp, med_bp, sur_threshold, sur_bp, rate_den,
+                out_ss, out_med_base, out_med_surcharge):
+    """_fica_cents over a 1-D array of int cents g, in parallel."""
+    for i in prange(g.size):
+        out_ss[i], out_med_base[i], out_med_surcharge[i] = _fica_cents(
+            g[i], ss_base, ss_bp, med_bp, sur_threshold, sur_bp, rate_den
+        )
+
+
+def _fica_cents_np(g: np.ndarray) -> tuple:
+    """NumPy form of _fica_cents over an array of int cents g."""
+    half = RATE_DEN // 2
+    social_security = (np.minimum(g, SS_WAGE_BASE_CENTS) * SS_RATE_BP + half) // RATE_DEN
+    medicare_base = (g * MEDICARE_RATE_BP + half) // RATE_DEN
+    medicare_surcharge = (
+        np.maximum(g - MEDICARE_SURCHARGE_THRESHOLD_CENTS, 0) * MEDICARE_SURCHARGE_RATE_BP
+        + half
+    ) // RATE_DEN
+    return social_security, medicare_base, medicare_surcharge
 
-def _interpolate_rate(schedule: list, income: float) -> float:
-    """
-    Look up effective state tax rate for given income using linear interpolation
-    between breakpoints in the schedule.
 
-    schedule: [(income_threshold, effective_rate), ...] sorted ascending
+def compute_fica_batch(gross_incomes) -> dict:
     """
-    if len(schedule) == 1:
-        return schedule[0][1]
+    Vectorized compute_fica() over an array of gross incomes.
 
-    # Find surrounding breakpoints
-    for i in range(len(schedule) - 1):
-        lo_inc, lo_rate = schedule[i]
-        hi_inc, hi_rate = schedule[i + 1]
-        if lo_inc <= income <= hi_inc:
-            if hi_inc == lo_inc:
-                return lo_rate
-            frac = (income - lo_inc) / (hi_inc - lo_inc)
-            return lo_rate + frac * (hi_rate - lo_rate)
+    Computed in int64 cents, matching compute_fica() exactly, by the
+    parallel _fica_batch kernel when Numba is available.
+
+    Returns
+    -------
+    dict of np.ndarray with the same keys as compute_fica().
+    """
+    g = _to_cents_array(gross_incomes)
+    if not NUMBA_AVAILABLE:
+        return _fica_dollars(*_fica_cents_np(g))
+    flat = np.ascontiguousarray(g).ravel()
+    components = (np.empty_like(flat), np.empty_like(flat), np.empty_like(flat))
+    _fica_batch(flat, *_FICA_PARAMS, *components)
+    return _fica_dollars(*(c.reshape(g.shape) for c in components))
 
-    # Beyond last breakpoint: use last rate
-    return schedule[-1][1]
 
+# ---------------------------------------------------------------------------
+# State Income Tax
+# ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=4096)
 def compute_state_tax(gross_income: float, state: str) -> float:
     """
     Compute 2025 state income tax for a single filer.
@@ -158,6 +277,14 @@ def compute_state_tax(gross_income: float, state: str) -> float:
     approximations valid for the salary range $20,000–$500,000. For states
     with no income tax (TX, FL, NV, WA, WY, TN), returns 0.
 
+    The effective rate is linearly interpolated between the schedule's
+    breakpoints (np.interp) and held constant beyond the last one.
+
+    Results are memoized (lru_cache) keyed on (gross_income, state) only.
+    The schedule itself is deliberately not part of the key: it is immutable
+    module-level data (STATE_TAX_SCHEDULE_ARR), bound when this module is
+    imported, so reload this module after reloading constants.py.
+
     Parameters
     ----------
     gross_income : float
@@ -175,21 +302,101 @@ def compute_state_tax(gross_income: float, state: str) -> float:
     ValueError
         If state is not found in the schedule table.
     """
+    return round(_state_tax_raw(gross_income, state), 2)
+
+
+def _state_tax_raw(gross_income: float, state: str) -> float:
+    """compute_state_tax() without rounding or memoization."""
+    if state in ZERO_TAX_STATES:
+        return 0.0
     if state not in STATE_TAX_SCHEDULE:
         raise ValueError(
             f"State '{state}' not in STATE_TAX_SCHEDULE. "
             f"Available states: {sorted(STATE_TAX_SCHEDULE.keys())}"
         )
 
-    schedule = STATE_TAX_SCHEDULE[state]
-    effective_rate = _interpolate_rate(schedule, gross_income)
-    return round(gross_income * effective_rate, 2)
+    rate = FLAT_STATE_RATE.get(state)
+    if rate is not None:
+        return gross_income * rate
+
+    incomes, rates = STATE_TAX_SCHEDULE_ARR[state]
+    return gross_income * float(np.interp(gross_income, incomes, rates))
+
+
+def state_effective_rate(state: str, incomes) -> np.ndarray:
+    """
+    Effective state tax rate for an array of incomes in a single state.
+
+    Evaluates the state's breakpoint schedule with one np.interp call over
+    the precomputed STATE_TAX_SCHEDULE_ARR arrays. No-tax states
+    (ZERO_TAX_STATES) and flat-rate states (FLAT_STATE_RATE) skip
+    interpolation entirely.
+
+    Raises
+    ------
+    ValueError
+        If state is not found in the schedule table.
+    """
+    if state not in STATE_TAX_SCHEDULE_ARR:
+        raise ValueError(
+            f"State '{state}' not in STATE_TAX_SCHEDULE. "
+            f"Available states: {sorted(STATE_TAX_SCHEDULE.keys())}"
+        )
+    incomes = np.asarray(incomes, dtype=np.float64)
+    if state in ZERO_TAX_STATES:
+        return np.zeros_like(incomes)
+    rate = FLAT_STATE_RATE.get(state)
+    if rate is not None:
+        return np.full_like(incomes, rate)
+    return np.interp(incomes, *STATE_TAX_SCHEDULE_ARR[state])
+
+
+def state_rate_lookup(states, incomes) -> np.ndarray:
+    """
+    Effective state tax rate for paired arrays of states and incomes.
+
+    Profiles are grouped by state (np.unique) so each schedule is evaluated
+    with a single state_effective_rate() call.
+    """
+    states = np.asarray(states)
+    incomes = np.asarray(incomes, dtype=np.float64)
+    unique_states, inverse = np.unique(states, return_inverse=True)
+    inverse = inverse.reshape(states.shape)
+
+    rates = np.empty_like(incomes)
+    for k, state in enumerate(unique_states):
+        mask = inverse == k
+        rates[mask] = state_effective_rate(str(state), incomes[mask])
+    return rates
+
+
+def compute_state_tax_batch(gross_incomes, states) -> np.ndarray:
+    """
+    Vectorized compute_state_tax() over arrays of incomes and states.
+
+    Parameters
+    ----------
+    gross_incomes : array_like
+        Annual gross salaries in USD.
+    states : array_like of str
+        Full state name for each income.
+
+    Returns
+    -------
+    np.ndarray
+        State income tax owed in USD, one entry per income (unrounded).
+    """
+    s = np.asarray(gross_incomes, dtype=np.float64)
+    return s * state_rate_lookup(states, s)
 
 
 def compute_all_taxes(gross_income: float, state: str) -> dict:
     """
     Compute all taxes for a given gross income and state.
 
+    Federal and FICA amounts are exact whole cents; state tax is left
+    unrounded and only 'total' is rounded to cents.
+
     Returns
     -------
     dict with keys:
@@ -199,9 +406,9 @@ def compute_all_taxes(gross_income: float, state: str) -> dict:
         'total'            : float
         'effective_total_rate': float  (total tax / gross)
     """
-    federal = compute_federal_tax(gross_income)
+    federal = _federal_tax_cents(_to_cents(gross_income)) / 100
     fica = compute_fica(gross_income)
-    state_tax = compute_state_tax(gross_income, state)
+    state_tax = _state_tax_raw(gross_income, state)
     total = round(federal + fica['total'] + state_tax, 2)
 
     return {
@@ -215,6 +422,141 @@ def compute_all_taxes(gross_income: float, state: str) -> dict:
     }
 
 
+@njit(cache=True)
+def _interp_rate(x, xs, ys, n):
+    """np.interp(x, xs[:n], ys[:n]) for one x (clamped at both ends)."""
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[n - 1]:
+        return ys[n - 1]
+    j = 1
+    while xs[j] <= x:
+        j += 1
+    slope = (ys[j] - ys[j - 1]) / (xs[j] - xs[j - 1])
+    return slope * (x - xs[j - 1]) + ys[j - 1]
+
+
+@njit(parallel=True, cache=True)
+def _all_taxes_kernel(g_cents, incomes, deduction, edges, bp,
+                      ss_base, ss_bp, med_bp, sur_threshold, sur_bp, rate_den,
+                      st_x, st_y, st_n, st_zero,
+                      out_federal, out_ss, out_med_base, out_med_surcharge,
+                      out_state, out_total):
+    """
+    Federal, FICA and every state's tax for each income in one pass.
+
+    Each income is read once; federal and FICA are computed once per income
+    and the state loop reuses them. Rows flagged in st_zero (no-income-tax
+    states) skip the rate interpolation. FICA components are written in int
+    cents; out_state / out_total are (S, N).
+    """
+    for i in prange(g_cents.size):
+        g = g_cents[i]
+        taxable = g - deduction
+        if taxable < 0:
+            taxable = 0
+        federal = _fed_tax_cents(taxable, edges, bp, rate_den)
+        ss, med_base, med_surcharge = _fica_cents(
+            g, ss_base, ss_bp, med_bp, sur_threshold, sur_bp, rate_den
+        )
+        out_federal[i] = federal / 100
+        out_ss[i] = ss
+        out_med_base[i] = med_base
+        out_med_surcharge[i] = med_surcharge
+        base = (federal + ss + med_base + med_surcharge) / 100
+        x = incomes[i]
+        for s in range(st_n.size):
+            if st_zero[s]:
+                state_tax = 0.0
+            else:
+                state_tax = x * _interp_rate(x, st_x[s], st_y[s], st_n[s])
+            out_state[s, i] = state_tax
+            out_total[s, i] = base + state_tax
+
+
+def compute_all_taxes_grid(incomes, states) -> dict:
+    """
+    Vectorized compute_all_taxes() over a salary grid × list of states.
+
+    Federal tax and FICA do not depend on the state, so they are computed
+    once for the salary grid. With Numba, _all_taxes_kernel fuses federal,
+    FICA and all states' tax into a single pass over the incomes; otherwise
+    state tax is one np.interp per state, stacked into an (n_states, n_incomes)
+    matrix. No-income-tax states are zero on both paths without interpolating.
+    State tax is not rounded.
+
+    Parameters
+    ----------
+    incomes : array_like
+        1-D grid of annual gross salaries in USD (length N).
+    states : list of str
+        Full state names (length S).
+
+    Returns
+    -------
+    dict with keys:
+        'federal'               : np.ndarray (N,)
+        'fica'                  : dict of np.ndarray (N,)  (compute_fica_batch keys)
+        'state'                 : np.ndarray (S, N)
+        'total'                 : np.ndarray (S, N)
+        'effective_total_rate'  : np.ndarray (S, N)
+        'effective_federal_rate': np.ndarray (N,)
+        'effective_state_rate'  : np.ndarray (S, N)
+    """
+    incomes = np.asarray(incomes, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        unknown = [state for state in states if state not in STATE_TAX_ROW]
+        if unknown:
+            raise ValueError(
+                f"State '{unknown[0]}' not in STATE_TAX_SCHEDULE. "
+                f"Available states: {sorted(STATE_TAX_SCHEDULE.keys())}"
+            )
+        rows = np.array([STATE_TAX_ROW[state] for state in states], dtype=np.intp)
+        zero = np.array([state in ZERO_TAX_STATES for state in states], dtype=np.bool_)
+        g = _to_cents_array(incomes)
+        federal = np.empty_like(incomes)
+        social_security = np.empty_like(g)
+        medicare_base = np.empty_like(g)
+        medicare_surcharge = np.empty_like(g)
+        state_tax = np.empty((rows.size, incomes.size))
+        total = np.empty_like(state_tax)
+        _all_taxes_kernel(
+            g, incomes, STANDARD_DEDUCTION_CENTS, BRACKET_EDGES_CENTS, BRACKET_RATE_BP,
+            *_FICA_PARAMS,
+            STATE_TAX_X_PAD[rows], STATE_TAX_Y_PAD[rows], STATE_TAX_N[rows], zero,
+            federal, social_security, medicare_base, medicare_surcharge,
+            state_tax, total,
+        )
+        fica = _fica_dollars(social_security, medicare_base, medicare_surcharge)
+    else:
+        federal, fica, state_tax, total = _all_taxes_grid_np(incomes, states)
+
+    positive = incomes > 0
+    safe = np.where(positive, incomes, 1.0)
+    return {
+        'federal': federal,
+        'fica': fica,
+        'state': state_tax,
+        'total': total,
+        'effective_total_rate': np.where(positive, total / safe, 0.0),
+        'effective_federal_rate': np.where(positive, federal / safe, 0.0),
+        'effective_state_rate': np.where(positive, state_tax / safe, 0.0),
+    }
+
+
+def _all_taxes_grid_np(incomes: np.ndarray, states) -> tuple:
+    """NumPy form of _all_taxes_kernel: (federal, fica, state, total)."""
+    g = _to_cents_array(incomes)
+    federal = _fed_tax_cents_np(np.maximum(g - STANDARD_DEDUCTION_CENTS, 0)) / 100
+    fica = _fica_dollars(*_fica_cents_np(g))
+    # reshape (not np.stack) so an empty state list gives a (0, N) matrix
+    state_tax = incomes * np.array(
+        [state_effective_rate(state, incomes) for state in states]
+    ).reshape(len(states), incomes.size)
+    total = (federal + fica['total']) + state_tax
+    return federal, fica, state_tax, total
+
+
 # ---------------------------------------------------------------------------
 # Validation helpers
 # ---------------------------------------------------------------------------
@@ -282,6 +624,57 @@ def validate_tax_module() -> None:
     print(f"  Expected effective rate: ~6.8%-7.5% (Tax Foundation 2025)")
     assert 0.06 < ca_rate < 0.08, f"CA rate {ca_rate:.3f} outside 6-8% range"
 
+    # --- Batch / grid paths agree with the scalar functions ---
+    # Both the Numba kernels (when installed) and the NumPy fallback helpers
+    # are checked; federal and FICA are whole cents, so they must match exactly.
+    incomes = np.concatenate([
+        np.linspace(0, 600_000, 241),
+        [17_000.5, 17_001, SS_WAGE_BASE, 200_000.01, 2_000_000],
+    ])
+    states = sorted(STATE_TAX_SCHEDULE.keys())
+    g = _to_cents_array(incomes)
+
+    federal = np.array([compute_federal_tax(x) for x in incomes])
+    assert np.array_equal(compute_federal_tax_batch(incomes), federal), "federal batch"
+    assert np.array_equal(
+        _fed_tax_cents_np(np.maximum(g - STANDARD_DEDUCTION_CENTS, 0)) / 100, federal
+    ), "federal NumPy fallback"
+
+    fica = [compute_fica(x) for x in incomes]
+    fica_batch = compute_fica_batch(incomes)
+    fica_np = _fica_dollars(*_fica_cents_np(g))
+    for key in fica[0]:
+        expected = np.array([f[key] for f in fica])
+        assert np.array_equal(fica_batch[key], expected), f"FICA batch '{key}'"
+        assert np.array_equal(fica_np[key], expected), f"FICA NumPy fallback '{key}'"
+
+    state_tax = np.array([[_state_tax_raw(x, st) for x in incomes] for st in states])
+    state_batch = compute_state_tax_batch(
+        np.tile(incomes, len(states)), np.repeat(states, incomes.size)
+    ).reshape(state_tax.shape)
+    assert np.allclose(state_batch, state_tax, rtol=0, atol=1e-6), "state batch"
+
+    total = np.array([[compute_all_taxes(x, st)['total'] for x in incomes] for st in states])
+    grid = compute_all_taxes_grid(incomes, states)
+    grid_np = dict(zip(('federal', 'fica', 'state', 'total'), _all_taxes_grid_np(incomes, states)))
+    for name, result in (('grid', grid), ('grid NumPy fallback', grid_np)):
+        assert np.array_equal(result['federal'], federal), f"{name} federal"
+        for key in fica[0]:
+            assert np.array_equal(result['fica'][key], fica_batch[key]), f"{name} FICA '{key}'"
+        assert np.allclose(result['state'], state_tax, rtol=0, atol=1e-6), f"{name} state"
+        # compute_all_taxes() rounds its total to the cent
+        assert np.allclose(result['total'], total, rtol=0, atol=0.005 + 1e-6), f"{name} total"
+    # An empty state list is valid and gives (0, N) state / total matrices
+    for result in (compute_all_taxes_grid(incomes, []),
+                   dict(zip(('federal', 'fica', 'state', 'total'),
+                            _all_taxes_grid_np(incomes, [])))):
+        assert result['state'].shape == result['total'].shape == (0, incomes.size), \
+            "grid with no states"
+        assert np.array_equal(result['federal'], federal), "grid with no states: federal"
+
+    print(f"\nBatch/grid vs scalar ({incomes.size} incomes × {len(states)} states, "
+          f"Numba={'on' if NUMBA_AVAILABLE else 'off'}): OK ✓")
+
     print("\nAll tax module validations PASSED ✓")
 
 
@@ -292,10 +685,12 @@ if __name__ == '__main__':
     print("\n\nEffective total tax rates at $65,000 by state:")
     print(f"{'State':<20} {'Federal':>10} {'FICA':>8} {'State':>8} {'Total':>8}")
     print("-" * 58)
-    for state in sorted(STATE_TAX_SCHEDULE.keys()):
-        result = compute_all_taxes(65_000, state)
+    states = sorted(STATE_TAX_SCHEDULE.keys())
+    grid = compute_all_taxes_grid([65_000], states)
+    fica_rate = grid['fica']['total'][0] / 65000
+    for i, state in enumerate(states):
         print(f"{state:<20} "
-              f"{result['effective_federal_rate']:>9.1%} "
-              f"{result['fica']['total']/65000:>7.1%} "
-              f"{result['effective_state_rate']:>7.1%} "
-              f"{result['effective_total_rate']:>7.1%}")
+              f"{grid['effective_federal_rate'][0]:>9.1%} "
+              f"{fica_rate:>7.1%} "
+              f"{grid['effective_state_rate'][i, 0]:>7.1%} "
+              f"{grid['effective_total_rate'][i, 0]:>7.1%}")